@@ -1,12 +0,0 @@
-"""Provide common functions and data structures used throughout the program."""
-from typing import NoReturn
-
-
-def assert_never(value: NoReturn) -> NoReturn:
-    """
-    Signal to mypy to perform an exhaustive matching.
-
-    Please see the following page for more details:
-    https://hakibenita.com/python-mypy-exhaustive-checking
-    """
-    assert False, f"Unhandled value: {value} ({type(value).__name__})"
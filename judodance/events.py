@@ -1,12 +1,10 @@
 """Define the actions."""
 import abc
 import enum
-from typing import Set, Union
+from typing import Iterable, Union
 
-from icontract import DBC
 
-
-class Event(DBC):
+class Event(abc.ABC):
     """Represent an abstract event in the game."""
 
     @abc.abstractmethod
@@ -29,27 +27,56 @@ class ReceivedQuit(Event):
 
 
 class Button(enum.Enum):
-    """Represent abstract buttons, not necessarily tied to a concrete joystick."""
+    """
+    Represent abstract buttons, not necessarily tied to a concrete joystick.
+
+    Each value is a distinct power of two, *i.e.*, the bit of the button in a mask.
+    """
+
+    CROSS = 1
+    UP = 2
+    CIRCLE = 4
+    RIGHT = 8
+    SQUARE = 16
+    DOWN = 32
+    TRIANGLE = 64
+    LEFT = 128
+
 
-    CROSS = 0
-    UP = 1
-    CIRCLE = 2
-    RIGHT = 3
-    SQUARE = 4
-    DOWN = 5
-    TRIANGLE = 6
-    LEFT = 7
+def mask_buttons(buttons: Iterable[Button]) -> int:
+    """
+    Pack the ``buttons`` into an integer bitmask with one bit per button.
+
+    Comparing two masks is much cheaper than comparing two sets of buttons.
+
+    >>> mask_buttons([Button.CROSS, Button.CIRCLE])
+    5
+    >>> mask_buttons([Button.LEFT, Button.LEFT])
+    128
+    >>> mask_buttons([])
+    0
+    """
+    mask = 0
+    for button in buttons:
+        mask |= button.value
+
+    return mask
 
 
 class ButtonsChanged(Event):
     """Capture the change in active (pressed) buttons."""
 
-    def __init__(self, active_button_set: Set[Button]) -> None:
+    #: Bitmask of the active buttons, see :py:func:`mask_buttons`
+    active_mask: int
+
+    def __init__(self, active_mask: int) -> None:
         """Initialize with the given values."""
-        self.active_button_set = active_button_set
+        self.active_mask = active_mask
 
     def __str__(self) -> str:
-        buttons_joined = ", ".join(button.name for button in self.active_button_set)
+        buttons_joined = ", ".join(
+            button.name for button in Button if self.active_mask & button.value
+        )
         return f"{self.__class__.__name__}({buttons_joined})"
 
 
@@ -84,3 +111,25 @@ class GameOver(Event):
 EventUnion = Union[
     Tick, ReceivedQuit, ButtonsChanged, Accomplished, TaskDone, NeedToAnnounce, GameOver
 ]
+
+# The events below carry no data. We share a single instance of each so that
+# we do not have to allocate a new event on every occurrence, *e.g.*, a tick
+# in every frame.
+
+#: The shared instance of :py:class:`Tick`
+TICK = Tick()
+
+#: The shared instance of :py:class:`ReceivedQuit`
+RECEIVED_QUIT = ReceivedQuit()
+
+#: The shared instance of :py:class:`Accomplished`
+ACCOMPLISHED = Accomplished()
+
+#: The shared instance of :py:class:`TaskDone`
+TASK_DONE = TaskDone()
+
+#: The shared instance of :py:class:`NeedToAnnounce`
+NEED_TO_ANNOUNCE = NeedToAnnounce()
+
+#: The shared instance of :py:class:`GameOver`
+GAME_OVER = GameOver()
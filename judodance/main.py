@@ -1,42 +1,115 @@
 """Practice judo techniques using a dancing pad."""
 import argparse
+import bisect
+import collections
 import importlib.resources
+import itertools
+import math
 import os.path
 import pathlib
 import random
 import sys
 import time
-from typing import Optional, Set, Final, List, MutableMapping, Union
+from typing import (
+    Optional,
+    Set,
+    Final,
+    List,
+    MutableMapping,
+    Tuple,
+    Mapping,
+    Type,
+    Callable,
+    Any,
+    Deque,
+    Sequence,
+    get_args,
+)
 
 import pygame
 from icontract import require, invariant
 
 import judodance
 import judodance.events
-from judodance.common import assert_never
 
 assert judodance.__doc__ == __doc__
 
 PACKAGE_DIR = (
     pathlib.Path(str(importlib.resources.files(__package__)))
-    if __package__ is not None
+    if __package__
     else pathlib.Path(os.path.realpath(__file__)).parent
 )
 
+#: Absolute path to the font as a string ready for pygame
+FONT_FSPATH = str(PACKAGE_DIR / "media/freesansbold.ttf")
+
+#: Absolute paths to the frames of the hourglass, in the order of the passing time,
+#: as strings ready for pygame
+HOURGLASS_FRAME_FSPATHS = (
+    str(PACKAGE_DIR / "media/hourglass/frame_01.png"),
+    str(PACKAGE_DIR / "media/hourglass/frame_02.png"),
+    str(PACKAGE_DIR / "media/hourglass/frame_03.png"),
+    str(PACKAGE_DIR / "media/hourglass/frame_04.png"),
+    str(PACKAGE_DIR / "media/hourglass/frame_05.png"),
+)
+
+#: Absolute path to the bronze medal as a string ready for pygame
+BRONZE_MEDAL_FSPATH = str(PACKAGE_DIR / "media/medals/bronze.png")
+
+#: Absolute path to the silver medal as a string ready for pygame
+SILVER_MEDAL_FSPATH = str(PACKAGE_DIR / "media/medals/silver.png")
+
+#: Absolute path to the gold medal as a string ready for pygame
+GOLD_MEDAL_FSPATH = str(PACKAGE_DIR / "media/medals/gold.png")
+
+#: Absolute paths to the medals, from the lowest to the highest
+MEDAL_FSPATHS = (BRONZE_MEDAL_FSPATH, SILVER_MEDAL_FSPATH, GOLD_MEDAL_FSPATH)
+
+#: Scores needed for the medals in :py:data:`MEDAL_FSPATHS` beyond the lowest one
+MEDAL_THRESHOLDS = (20, 30)
+
+#: Number of frames per second the main loop is capped at.
+#:
+#: Each frame issues exactly one tick.
+FRAMES_PER_SECOND = 60
+
+
+#: Number of ticks the pressed buttons need to stay unchanged before we accept them.
+#:
+#: The switches of a dance mat bounce on contact so that a single step produces
+#: a burst of button changes.
+DEBOUNCE_TICKS = 3
+
+
+def seconds_to_ticks(seconds: float) -> int:
+    """Convert the duration in ``seconds`` to the number of ticks of the main loop."""
+    return math.ceil(seconds * FRAMES_PER_SECOND)
+
 
 class Task:
     """Represent a game task to be accomplished."""
 
+    __slots__ = (
+        "expected_position",
+        "announcement",
+        "expected_mask",
+        "picture",
+        "score_delta",
+        "expected_position_fspath",
+        "announcement_fspath",
+        "picture_fspath",
+    )
+
     #: Relative path to the picture representing the task in the package data
     expected_position: Final[pathlib.Path]
 
     #: Relative path to the audio file announcing the task in the package data
     announcement: Final[pathlib.Path]
 
-    #: Set of buttons which need to be active to accomplish the task.
+    #: Bitmask of buttons which need to be active to accomplish the task.
     #:
-    #: Empty means back to the cool down position.
-    expected_buttons: Final[Set[judodance.events.Button]]
+    #: Zero means back to the cool down position.
+    expected_mask: Final[int]
 
     #: Relative path to the picture illustrating the task in more abstract terms
     picture: Final[pathlib.Path]
@@ -44,6 +117,15 @@ class Task:
     #: Number of points that accomplishing this task brings
     score_delta: Final[int]
 
+    #: Absolute path to :py:attr:`expected_position` as a string ready for pygame
+    expected_position_fspath: Final[str]
+
+    #: Absolute path to :py:attr:`announcement` as a string ready for pygame
+    announcement_fspath: Final[str]
+
+    #: Absolute path to :py:attr:`picture` as a string ready for pygame
+    picture_fspath: Final[str]
+
     @require(lambda picture: not picture.is_absolute())
     @require(lambda announcement: not announcement.is_absolute())
     def __init__(
@@ -57,14 +139,26 @@ class Task:
         """Initialize with the given values."""
         self.expected_position = expected_position
         self.announcement = announcement
-        self.expected_buttons = expected_buttons
+        self.expected_mask = judodance.events.mask_buttons(expected_buttons)
         self.picture = picture
         self.score_delta = score_delta
 
+        self.expected_position_fspath = str(PACKAGE_DIR / expected_position)
+        self.announcement_fspath = str(PACKAGE_DIR / announcement)
+        self.picture_fspath = str(PACKAGE_DIR / picture)
+
 
 class TaskDatabase:
     """Organize the task transition."""
 
+    __slots__ = (
+        "tasks",
+        "cool_down",
+        "accomplishment",
+        "reminder_slack",
+        "accomplishment_fspath",
+    )
+
     #: The list of tasks excluding the cool down
     tasks: Final[List[Task]]
 
@@ -74,9 +168,12 @@ class TaskDatabase:
     #: Relative path to the accomplishment sound
     accomplishment: Final[pathlib.Path]
 
-    #: How long to wait to play the reminder after announcing the task
+    #: How long to wait, in seconds, to play the reminder after announcing the task
     reminder_slack: Final[float]
 
+    #: Absolute path to :py:attr:`accomplishment` as a string ready for pygame
+    accomplishment_fspath: Final[str]
+
     @require(lambda tasks, cool_down: cool_down not in tasks)
     @require(lambda accomplishment: not accomplishment.is_absolute())
     def __init__(
@@ -89,6 +186,8 @@ class TaskDatabase:
 
         self.reminder_slack = 5
 
+        self.accomplishment_fspath = str(PACKAGE_DIR / accomplishment)
+
 
 # noinspection SpellCheckingInspection
 def create_task_database() -> TaskDatabase:
@@ -171,15 +270,33 @@ def create_task_database() -> TaskDatabase:
 
 def check_all_files_exist(task_database: TaskDatabase) -> Optional[str]:
     """Check that all files exist, and return an error, if any."""
-    pths = [PACKAGE_DIR / task_database.accomplishment]  # type: List[pathlib.Path]
+    pths = [FONT_FSPATH, task_database.accomplishment_fspath]  # type: List[str]
+
+    for task in itertools.chain(task_database.tasks, (task_database.cool_down,)):
+        pths.append(task.announcement_fspath)
+        pths.append(task.expected_position_fspath)
+        pths.append(task.picture_fspath)
 
-    for task in task_database.tasks + [task_database.cool_down]:
-        pths.append(PACKAGE_DIR / task.announcement)
-        pths.append(PACKAGE_DIR / task.expected_position)
-        pths.append(PACKAGE_DIR / task.picture)
+    pths.extend(HOURGLASS_FRAME_FSPATHS)
+    pths.extend(MEDAL_FSPATHS)
+
+    # We list each directory only once instead of querying every file separately.
+    names_by_directory = dict()  # type: MutableMapping[str, Set[str]]
 
     for pth in pths:
-        if not pth.exists():
+        directory, name = os.path.split(pth)
+
+        names = names_by_directory.get(directory, None)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                names = set()
+
+            names_by_directory[directory] = names
+
+        if name not in names:
             return f"The media file does not exist: {pth}"
 
     return None
@@ -189,43 +306,80 @@ def check_all_files_exist(task_database: TaskDatabase) -> Optional[str]:
 class State:
     """Capture the global state of the game."""
 
+    __slots__ = (
+        "received_quit",
+        "task",
+        "tick_count",
+        "next_reminder",
+        "active_mask",
+        "pending_mask",
+        "pending_mask_ticks",
+        "accomplished",
+        "accomplished_played",
+        "score",
+        "game_start",
+        "game_time",
+        "game_end",
+        "game_over",
+        "dirty",
+    )
+
     #: Set if we received the signal to quit the game
     received_quit: bool
 
     #: Indicate the current task
     task: Task
 
-    #: Seconds since epoch to be reminded the next time about the task
-    next_reminder: Optional[float]
+    #: Number of ticks since the game start
+    tick_count: int
+
+    #: Tick at which to remind the next time about the task
+    next_reminder: Optional[int]
+
+    #: Bitmask of the currently pressed buttons, debounced
+    active_mask: int
+
+    #: Bitmask of the most recently reported buttons, not yet debounced
+    pending_mask: int
 
-    #: Currently pressed buttons
-    active_button_set: Set[judodance.events.Button]
+    #: Number of ticks since :py:attr:`pending_mask` has changed
+    pending_mask_ticks: int
 
     #: Set if the task has been accomplished
     accomplished: bool
 
-    #: Seconds since epoch when the task will be accomplished and the next task picked
+    #: Time on the monotonic clock when the task will be accomplished and the next
+    #: task picked
     accomplished_played: Optional[float]
 
-    #: Timestamp when the game started, seconds since epoch
+    #: Points collected so far
+    score: int
+
+    #: Time on the monotonic clock when the game started
     game_start: Final[float]
 
     #: Seconds since the game start
     game_time: float
 
-    #: Timestamp when the game is to end, seconds since epoch
+    #: Time on the monotonic clock when the game is to end
     game_end: Final[float]
 
     #: Set when the time is up
     game_over: bool
 
+    #: Set if the state changed since the last rendering
+    dirty: bool
+
     @require(lambda game_start, game_end: game_start <= game_end)
     def __init__(self, initial_task: Task, game_start: float, game_end: float) -> None:
         """Initialize with the given values and the defaults."""
         self.received_quit = False
         self.task = initial_task
+        self.tick_count = 0
         self.next_reminder = None
-        self.active_button_set = set()
+        self.active_mask = 0
+        self.pending_mask = 0
+        self.pending_mask_ticks = 0
         self.accomplished = False
         self.accomplished_played = None
 
@@ -236,259 +390,623 @@ class State:
         self.game_end = game_end
         self.game_over = False
 
+        self.dirty = True
+
+
+SOUND_CACHE = dict()  # type: MutableMapping[str, pygame.mixer.Sound]
+
+#: Lengths of the sounds in :py:data:`SOUND_CACHE`, in seconds
+SOUND_LENGTH_CACHE = dict()  # type: MutableMapping[str, float]
+
+
+@require(lambda fspath: os.path.isabs(fspath))
+def load_sound_or_retrieve_from_cache(fspath: str) -> pygame.mixer.Sound:
+    """Load and decode the sound or retrieve it from the memory cache."""
+    sound = SOUND_CACHE.get(fspath, None)
+    if sound is not None:
+        return sound
+
+    sound = pygame.mixer.Sound(fspath)
+    SOUND_CACHE[fspath] = sound
+    SOUND_LENGTH_CACHE[fspath] = sound.get_length()
+    return sound
+
+
+def preload_sounds(task_database: TaskDatabase) -> None:
+    """Decode all the sounds up-front so that playing them needs no disk access."""
+    load_sound_or_retrieve_from_cache(task_database.accomplishment_fspath)
+
+    for task in itertools.chain(task_database.tasks, (task_database.cool_down,)):
+        load_sound_or_retrieve_from_cache(task.announcement_fspath)
 
-@require(lambda path: not path.is_absolute())
-def play_sound(path: pathlib.Path) -> float:
+
+@require(lambda fspath: os.path.isabs(fspath))
+def play_sound(fspath: str) -> float:
     """Start playing the sound and returns its length."""
-    sound = pygame.mixer.Sound(str(PACKAGE_DIR / path))
+    sound = load_sound_or_retrieve_from_cache(fspath)
     sound.play()
-    return sound.get_length()
+    return SOUND_LENGTH_CACHE[fspath]
 
 
-def handle(
+def handle_tick(
     state: State,
-    our_event_queue: List[judodance.events.EventUnion],
+    event: judodance.events.Tick,
+    our_event_queue: Deque[judodance.events.EventUnion],
     task_database: TaskDatabase,
+    now: float,
 ) -> None:
-    """Consume the first action in the queue."""
-    if len(our_event_queue) == 0:
+    """Handle the time."""
+    # Nothing changes any more once the time is up, so we must not re-announce
+    # the game over and re-draw the screen on every tick.
+    if state.game_over:
         return
 
-    now = time.time()
-    event = our_event_queue.pop(0)
-
-    if isinstance(event, judodance.events.ReceivedQuit):
-        state.received_quit = True
-
-    elif isinstance(event, judodance.events.NeedToAnnounce):
-        # Announce only the techniques; it's too boring to hear the "cool down" sound
-        # all the time
-        if state.task is not task_database.cool_down:
-            announcement_length = play_sound(state.task.announcement)
-            state.next_reminder = (
-                now + announcement_length + task_database.reminder_slack
-            )
-        else:
-            state.next_reminder = now + task_database.reminder_slack
-
-    elif isinstance(event, judodance.events.ButtonsChanged):
-        state.active_button_set = event.active_button_set.copy()
-
-    elif isinstance(event, judodance.events.Accomplished):
-        if state.task is not task_database.cool_down:
-            accomplished_sound_length = play_sound(task_database.accomplishment)
-            state.accomplished_played = now + accomplished_sound_length
-        else:
-            our_event_queue.append(judodance.events.TaskDone())
-
-    elif isinstance(event, judodance.events.TaskDone):
-        # Pick the next task
-        if state.task is task_database.cool_down:
-            state.task = random.choice(task_database.tasks)
-        else:
-            state.score += state.task.score_delta
-            state.task = task_database.cool_down
-
-        state.accomplished = False
+    if now > state.game_end:
+        our_event_queue.append(judodance.events.GAME_OVER)
+        return
+
+    state.tick_count += 1
+
+    hourglass_before = determine_hourglass_frame(state)
+    state.game_time = now - state.game_start
+    if determine_hourglass_frame(state) != hourglass_before:
+        state.dirty = True
+
+    if state.accomplished_played is not None and now >= state.accomplished_played:
+        our_event_queue.append(judodance.events.TASK_DONE)
+
+    elif state.next_reminder is not None and state.tick_count >= state.next_reminder:
+        announcement_length = play_sound(state.task.announcement_fspath)
+        state.next_reminder = state.tick_count + seconds_to_ticks(
+            announcement_length + task_database.reminder_slack
+        )
+    else:
+        # No side effect based on time
+        pass
+
+    if state.pending_mask != state.active_mask:
+        state.pending_mask_ticks += 1
+        if state.pending_mask_ticks >= DEBOUNCE_TICKS:
+            state.active_mask = state.pending_mask
+
+    # If the player jumped to the button *before* the announcement, we still
+    # want to react to the correct position. That is, we can not react only on
+    # change of buttons, but need to constantly check if the task has not been
+    # accomplished.
+    if not state.accomplished and state.active_mask == state.task.expected_mask:
+        state.accomplished = True
         state.next_reminder = None
-        state.accomplished_played = None
-
-        our_event_queue.append(judodance.events.NeedToAnnounce())
-
-    elif isinstance(event, judodance.events.GameOver):
-        state.game_over = True
-
-    elif isinstance(event, judodance.events.Tick):
-        # Handle the time
-
-        if now > state.game_end:
-            our_event_queue.append(judodance.events.GameOver())
-        else:
-            state.game_time = now - state.game_start
-
-            if (
-                state.accomplished_played is not None
-                and now >= state.accomplished_played
-            ):
-                our_event_queue.append(judodance.events.TaskDone())
-
-            elif state.next_reminder is not None and now >= state.next_reminder:
-                announcement_length = play_sound(state.task.announcement)
-                state.next_reminder = (
-                    now + announcement_length + +task_database.reminder_slack
-                )
-            else:
-                # No side effect based on time
-                pass
-
-            # If the player jumped to the button *before* the announcement, we still
-            # want to react to the correct position. That is, we can not react only on
-            # change of buttons, but need to constantly check if the task has not been
-            # accomplished.
-            if (
-                state.active_button_set == state.task.expected_buttons
-                and not state.accomplished
-            ):
-                state.accomplished = True
-                state.next_reminder = None
-                our_event_queue.append(judodance.events.Accomplished())
+        our_event_queue.append(judodance.events.ACCOMPLISHED)
 
+
+def handle_received_quit(
+    state: State,
+    event: judodance.events.ReceivedQuit,
+    our_event_queue: Deque[judodance.events.EventUnion],
+    task_database: TaskDatabase,
+    now: float,
+) -> None:
+    """Mark that we need to exit the game."""
+    state.received_quit = True
+
+
+def handle_need_to_announce(
+    state: State,
+    event: judodance.events.NeedToAnnounce,
+    our_event_queue: Deque[judodance.events.EventUnion],
+    task_database: TaskDatabase,
+    now: float,
+) -> None:
+    """Announce the current task and schedule the reminder."""
+    # Announce only the techniques; it's too boring to hear the "cool down" sound
+    # all the time
+    if state.task is not task_database.cool_down:
+        announcement_length = play_sound(state.task.announcement_fspath)
+        state.next_reminder = state.tick_count + seconds_to_ticks(
+            announcement_length + task_database.reminder_slack
+        )
     else:
-        assert_never(event)
+        state.next_reminder = state.tick_count + seconds_to_ticks(
+            task_database.reminder_slack
+        )
+
+
+def handle_buttons_changed(
+    state: State,
+    event: judodance.events.ButtonsChanged,
+    our_event_queue: Deque[judodance.events.EventUnion],
+    task_database: TaskDatabase,
+    now: float,
+) -> None:
+    """
+    Record the currently pressed buttons to be debounced on the ticks.
+
+    The buttons are accepted only after they stayed unchanged for
+    :py:data:`DEBOUNCE_TICKS` ticks, and any change starts the count anew:
+
+    >>> import collections
+    >>> db = create_task_database()
+    >>> state = State(db.tasks[0], game_start=0.0, game_end=60.0)
+    >>> queue = collections.deque()
+    >>> cross = judodance.events.Button.CROSS.value
+    >>> up = judodance.events.Button.UP.value
+
+    >>> handle_buttons_changed(
+    ...     state, judodance.events.ButtonsChanged(cross), queue, db, 0.0
+    ... )
+    >>> handle_tick(state, judodance.events.TICK, queue, db, 0.0)
+    >>> state.pending_mask_ticks
+    1
+
+    >>> handle_buttons_changed(
+    ...     state, judodance.events.ButtonsChanged(cross | up), queue, db, 0.0
+    ... )
+    >>> state.pending_mask_ticks
+    0
+
+    >>> for _ in range(DEBOUNCE_TICKS - 1):
+    ...     handle_tick(state, judodance.events.TICK, queue, db, 0.0)
+    >>> state.active_mask
+    0
+    >>> handle_tick(state, judodance.events.TICK, queue, db, 0.0)
+    >>> state.active_mask == cross | up
+    True
+    """
+    if event.active_mask != state.pending_mask:
+        state.pending_mask = event.active_mask
+        state.pending_mask_ticks = 0
+
+
+def handle_accomplished(
+    state: State,
+    event: judodance.events.Accomplished,
+    our_event_queue: Deque[judodance.events.EventUnion],
+    task_database: TaskDatabase,
+    now: float,
+) -> None:
+    """Celebrate the accomplishment, if the task was a technique."""
+    if state.task is not task_database.cool_down:
+        accomplished_sound_length = play_sound(task_database.accomplishment_fspath)
+        state.accomplished_played = now + accomplished_sound_length
+    else:
+        our_event_queue.append(judodance.events.TASK_DONE)
+
+
+def handle_task_done(
+    state: State,
+    event: judodance.events.TaskDone,
+    our_event_queue: Deque[judodance.events.EventUnion],
+    task_database: TaskDatabase,
+    now: float,
+) -> None:
+    """Pick the next task."""
+    if state.task is task_database.cool_down:
+        state.task = random.choice(task_database.tasks)
+    else:
+        state.score += state.task.score_delta
+        state.task = task_database.cool_down
+
+    state.dirty = True
+    state.accomplished = False
+    state.next_reminder = None
+    state.accomplished_played = None
+
+    our_event_queue.append(judodance.events.NEED_TO_ANNOUNCE)
+
+
+def handle_game_over(
+    state: State,
+    event: judodance.events.GameOver,
+    our_event_queue: Deque[judodance.events.EventUnion],
+    task_database: TaskDatabase,
+    now: float,
+) -> None:
+    """Mark that the time is up."""
+    state.game_over = True
+    state.dirty = True
+
+
+#: Handle a specific event given the state, the event queue, the task database and
+#: the current time
+EventHandler = Callable[
+    [State, Any, Deque[judodance.events.EventUnion], TaskDatabase, float], None
+]
+
+#: Map each event type to its handler.
+#:
+#: A single look-up on the type is cheaper than a chain of ``isinstance`` checks,
+#: especially for the tick which comes with every frame.
+HANDLERS = {
+    judodance.events.Tick: handle_tick,
+    judodance.events.ReceivedQuit: handle_received_quit,
+    judodance.events.NeedToAnnounce: handle_need_to_announce,
+    judodance.events.ButtonsChanged: handle_buttons_changed,
+    judodance.events.Accomplished: handle_accomplished,
+    judodance.events.TaskDone: handle_task_done,
+    judodance.events.GameOver: handle_game_over,
+}  # type: Mapping[Type[judodance.events.Event], EventHandler]
+
+assert all(
+    event_type in HANDLERS for event_type in get_args(judodance.events.EventUnion)
+), "Expected a handler for each event in the event union"
+
+
+def handle(
+    state: State,
+    our_event_queue: Deque[judodance.events.EventUnion],
+    task_database: TaskDatabase,
+    now: float,
+) -> None:
+    """
+    Consume the first action in the queue.
+
+    :param state: to be modified
+    :param our_event_queue: from which the event is consumed
+    :param task_database: tasks to pick from
+    :param now: time on the monotonic clock, sampled once per frame
+    """
+    if len(our_event_queue) == 0:
+        return
+
+    event = our_event_queue.popleft()
+
+    HANDLERS[type(event)](state, event, our_event_queue, task_database, now)
+
+
+class Layout:
+    """Capture the measures of the screen which the rendering relies on."""
+
+    __slots__ = ("width", "height", "oneph", "onepw", "center_x")
+
+    #: Width of the screen in pixels
+    width: Final[int]
+
+    #: Height of the screen in pixels
+    height: Final[int]
+
+    #: One percent of the screen height in pixels, at least one pixel
+    oneph: Final[int]
+
+    #: Horizontal margin unit in pixels, at least one pixel
+    onepw: Final[int]
+
+    #: Horizontal center of the screen in pixels
+    center_x: Final[int]
+
+    def __init__(self, surface: pygame.surface.Surface) -> None:
+        """Measure the ``surface``."""
+        self.width = surface.get_width()
+        self.height = surface.get_height()
+
+        self.oneph = max(1, int(0.01 * self.height))
+        self.onepw = max(1, int(0.01 * self.height))
+
+        self.center_x = int(self.width / 2)
 
 
 @require(lambda percentage: 0 <= percentage <= 1)
-def rescale_image_relative_to_surface_width(
-    image: pygame.surface.Surface, percentage: float, surface: pygame.surface.Surface
+def rescale_image_relative_to_screen_width(
+    fspath: str,
+    percentage: float,
+    layout: Layout,
 ) -> pygame.surface.Surface:
-    """Rescale the image as a percentage of the ``surface`` size."""
+    """Rescale the image as a percentage of the screen width given in ``layout``."""
+    image = load_image_or_retrieve_from_cache(fspath)
+
     image_rect = image.get_rect()
     image_width = image_rect.width
     image_height = image_rect.height
 
-    new_image_width = int(surface.get_width() * percentage)
+    new_image_width = int(layout.width * percentage)
     new_image_height = int(image_height * (new_image_width / image_width))
 
-    return pygame.transform.scale(image, (new_image_width, new_image_height))
+    return rescale_image_or_retrieve_from_cache(
+        fspath, (new_image_width, new_image_height)
+    )
 
 
 @require(lambda percentage: 0 <= percentage <= 1)
-def rescale_image_relative_to_surface_height(
-    image: pygame.surface.Surface, percentage: float, surface: pygame.surface.Surface
+def rescale_image_relative_to_screen_height(
+    fspath: str,
+    percentage: float,
+    layout: Layout,
 ) -> pygame.surface.Surface:
-    """Rescale the image as a percentage of the ``surface`` size."""
+    """Rescale the image as a percentage of the screen height given in ``layout``."""
+    image = load_image_or_retrieve_from_cache(fspath)
+
     image_rect = image.get_rect()
     image_width = image_rect.width
     image_height = image_rect.height
 
-    new_image_height = int(surface.get_height() * percentage)
+    new_image_height = int(layout.height * percentage)
     new_image_width = int(image_width * (new_image_height / image_height))
 
-    return pygame.transform.scale(image, (new_image_width, new_image_height))
+    return rescale_image_or_retrieve_from_cache(
+        fspath, (new_image_width, new_image_height)
+    )
+
 
+#: Identify what has been drawn where on the screen
+Drawing = List[Tuple[str, pygame.Rect]]
 
-def render_game_over(state: State, surface: pygame.surface.Surface) -> None:
+
+def blit_all(
+    surface: pygame.surface.Surface,
+    items: Sequence[Tuple[str, pygame.surface.Surface, Tuple[int, int]]],
+) -> Drawing:
+    """
+    Blit all the ``items`` on the ``surface`` in a single call.
+
+    Each item is given as an identifier of the content, the source surface and
+    the destination.
+    """
+    rects = surface.blits([(source, dest) for _, source, dest in items])
+    assert rects is not None
+
+    return [(identifier, rect) for (identifier, _, _), rect in zip(items, rects)]
+
+
+def determine_medal(score: int) -> str:
+    """
+    Determine the path to the medal awarded for the ``score``.
+
+    >>> os.path.basename(determine_medal(0))
+    'bronze.png'
+    >>> os.path.basename(determine_medal(19))
+    'bronze.png'
+    >>> os.path.basename(determine_medal(20))
+    'silver.png'
+    >>> os.path.basename(determine_medal(29))
+    'silver.png'
+    >>> os.path.basename(determine_medal(30))
+    'gold.png'
+    """
+    return MEDAL_FSPATHS[bisect.bisect_right(MEDAL_THRESHOLDS, score)]
+
+
+def render_game_over(
+    state: State, surface: pygame.surface.Surface, layout: Layout
+) -> Drawing:
     """Render the "game over" dialogue."""
-    oneph = max(1, int(0.01 * surface.get_height()))
-    onepw = max(1, int(0.01 * surface.get_height()))
+    oneph = layout.oneph
+    onepw = layout.onepw
 
     surface.fill((0, 0, 0))
 
-    font_large = pygame.font.Font(PACKAGE_DIR / "media/freesansbold.ttf", 5 * oneph)
-    game_over = font_large.render("Game Over", True, (255, 255, 255))
+    game_over = render_text_or_retrieve_from_cache("Game Over", 5 * oneph)
     game_over_xy = (
-        int(surface.get_width() / 2) - int(game_over.get_width() / 2),
-        int(surface.get_height() / 2) - int(game_over.get_height() / 2),
+        layout.center_x - int(game_over.get_width() / 2),
+        int(layout.height / 2) - int(game_over.get_height() / 2),
     )
 
-    surface.blit(game_over, game_over_xy)
-
-    score = font_large.render(f"Score: {state.score}", True, (255, 255, 255))
+    score = render_text_or_retrieve_from_cache(f"Score: {state.score}", 5 * oneph)
     score_xy = (
-        int(surface.get_width() / 2) - int(score.get_width() / 2),
+        layout.center_x - int(score.get_width() / 2),
         game_over_xy[1] + game_over.get_height() + oneph,
     )
-    surface.blit(score, score_xy)
 
-    if state.score < 20:
-        medal_pth = "media/medals/bronze.png"
-    elif state.score < 30:
-        medal_pth = "media/medals/silver.png"
-    else:
-        medal_pth = "media/medals/gold.png"
+    medal_fspath = determine_medal(state.score)
 
-    medal = load_image_or_retrieve_from_cache(medal_pth)
+    medal = load_image_or_retrieve_from_cache(medal_fspath)
     medal_xy = (
-        int(surface.get_width() / 2) - int(medal.get_width() / 2),
+        layout.center_x - int(medal.get_width() / 2),
         score_xy[1] + score.get_height() + oneph,
     )
-    surface.blit(medal, medal_xy)
 
-    font_small = pygame.font.Font(PACKAGE_DIR / "media/freesansbold.ttf", 2 * oneph)
-    escape = font_small.render('Press ESC or "q" to quit', True, (255, 255, 255))
-    surface.blit(
-        escape,
-        (onepw, surface.get_height() - escape.get_height() - 2 * oneph),
-    )
+    escape = render_text_or_retrieve_from_cache('Press ESC or "q" to quit', 2 * oneph)
+    escape_xy = (onepw, layout.height - escape.get_height() - 2 * oneph)
 
+    return blit_all(
+        surface,
+        [
+            ("Game Over", game_over, game_over_xy),
+            (f"Score: {state.score}", score, score_xy),
+            (medal_fspath, medal, medal_xy),
+            ("Press ESC", escape, escape_xy),
+        ],
+    )
 
-def render_game(state: State, surface: pygame.surface.Surface) -> None:
-    """Render the game on the screen."""
-    surface.fill((0, 0, 0))
 
-    oneph = max(1, int(0.01 * surface.get_height()))
-    onepw = max(1, int(0.01 * surface.get_height()))
+def determine_hourglass_frame(state: State) -> str:
+    """Determine the path to the hourglass frame corresponding to the game time."""
+    game_time_fraction = state.game_time / (state.game_end - state.game_start)
 
-    position = load_image_or_retrieve_from_cache(state.task.expected_position)
+    frame_count = len(HOURGLASS_FRAME_FSPATHS)
+    return HOURGLASS_FRAME_FSPATHS[
+        min(frame_count - 1, int(game_time_fraction * frame_count))
+    ]
 
-    position = rescale_image_relative_to_surface_width(position, 0.4, surface)
 
-    surface.blit(position, (onepw, oneph))
+def rescale_task_images(
+    task: Task, layout: Layout
+) -> Tuple[pygame.surface.Surface, pygame.surface.Surface]:
+    """Rescale the expected position and the picture of the task for the screen."""
+    position = rescale_image_relative_to_screen_width(
+        task.expected_position_fspath, 0.4, layout
+    )
 
-    picture = load_image_or_retrieve_from_cache(state.task.picture)
+    picture = load_image_or_retrieve_from_cache(task.picture_fspath)
 
     if picture.get_height() > picture.get_width():
-        picture = rescale_image_relative_to_surface_height(picture, 0.7, surface)
+        picture = rescale_image_relative_to_screen_height(
+            task.picture_fspath, 0.7, layout
+        )
     else:
-        picture = rescale_image_relative_to_surface_width(picture, 0.4, surface)
+        picture = rescale_image_relative_to_screen_width(
+            task.picture_fspath, 0.4, layout
+        )
+
+    return position, picture
+
+
+def rescale_hourglass_frame(fspath: str, layout: Layout) -> pygame.surface.Surface:
+    """Rescale the hourglass frame given as ``fspath`` for the screen."""
+    return rescale_image_relative_to_screen_width(fspath, 0.3, layout)
+
+
+def preload_images(task_database: TaskDatabase, layout: Layout) -> None:
+    """Load and rescale all the images so that rendering needs no disk access."""
+    for task in itertools.chain(task_database.tasks, (task_database.cool_down,)):
+        rescale_task_images(task, layout)
+
+    for fspath in HOURGLASS_FRAME_FSPATHS:
+        rescale_hourglass_frame(fspath, layout)
+
+    for fspath in MEDAL_FSPATHS:
+        load_image_or_retrieve_from_cache(fspath)
+
+
+def render_game(
+    state: State, surface: pygame.surface.Surface, layout: Layout
+) -> Drawing:
+    """Render the game on the screen."""
+    surface.fill((0, 0, 0))
+
+    oneph = layout.oneph
+    onepw = layout.onepw
+
+    position, picture = rescale_task_images(state.task, layout)
+    position_xy = (onepw, oneph)
 
     picture_xy = (position.get_width() + 3 * onepw, oneph)
-    surface.blit(picture, picture_xy)
 
-    font_large = pygame.font.Font(PACKAGE_DIR / "media/freesansbold.ttf", 5 * oneph)
-    score = font_large.render(f"Score: {state.score}", True, (255, 255, 255))
+    score = render_text_or_retrieve_from_cache(f"Score: {state.score}", 5 * oneph)
     score_xy = (position.get_width() + 3 * onepw, picture.get_height() + 3 * oneph)
-    surface.blit(score, score_xy)
 
-    game_time_fraction = state.game_time / (state.game_end - state.game_start)
-    if game_time_fraction < 1 / 5:
-        hourglass_pth = "media/hourglass/frame_01.png"
-    elif game_time_fraction < 2 / 5:
-        hourglass_pth = "media/hourglass/frame_02.png"
-    elif game_time_fraction < 3 / 5:
-        hourglass_pth = "media/hourglass/frame_03.png"
-    elif game_time_fraction < 4 / 5:
-        hourglass_pth = "media/hourglass/frame_04.png"
-    else:
-        hourglass_pth = "media/hourglass/frame_05.png"
-
-    hourglass = load_image_or_retrieve_from_cache(hourglass_pth)
-    hourglass = rescale_image_relative_to_surface_width(hourglass, 0.3, surface)
+    hourglass_fspath = determine_hourglass_frame(state)
+    hourglass = rescale_hourglass_frame(hourglass_fspath, layout)
 
     hourglass_xy = (picture_xy[0] + picture.get_width() + onepw, picture_xy[1])
-    surface.blit(hourglass, hourglass_xy)
 
-    font_small = pygame.font.Font(PACKAGE_DIR / "media/freesansbold.ttf", 2 * oneph)
-    escape = font_small.render('Press ESC or "q" to quit', True, (255, 255, 255))
-    surface.blit(
-        escape,
-        (onepw, surface.get_height() - escape.get_height() - 2 * oneph),
+    escape = render_text_or_retrieve_from_cache('Press ESC or "q" to quit', 2 * oneph)
+    escape_xy = (onepw, layout.height - escape.get_height() - 2 * oneph)
+
+    return blit_all(
+        surface,
+        [
+            (state.task.expected_position_fspath, position, position_xy),
+            (state.task.picture_fspath, picture, picture_xy),
+            (f"Score: {state.score}", score, score_xy),
+            (hourglass_fspath, hourglass, hourglass_xy),
+            ("Press ESC", escape, escape_xy),
+        ],
     )
 
 
 IMAGE_CACHE = dict()  # type: MutableMapping[str, pygame.surface.Surface]
 
 
-@require(lambda path: not os.path.isabs(str(path)))
-def load_image_or_retrieve_from_cache(
-    path: Union[str, os.PathLike[str]]
+@require(lambda fspath: os.path.isabs(fspath))
+def load_image_or_retrieve_from_cache(fspath: str) -> pygame.surface.Surface:
+    """
+    Load the image or retrieve it from the memory cache.
+
+    The display mode must have been already set.
+    """
+    image = IMAGE_CACHE.get(fspath, None)
+    if image is not None:
+        return image
+
+    image = pygame.image.load(fspath)
+
+    # Convert the image to the pixel format of the display once so that the blits
+    # need not convert it over and over again.
+    if image.get_flags() & pygame.SRCALPHA:
+        image = image.convert_alpha()
+    else:
+        image = image.convert()
+
+    IMAGE_CACHE[fspath] = image
+    return image
+
+
+SCALED_IMAGE_CACHE = (
+    dict()
+)  # type: MutableMapping[Tuple[str, int, int], pygame.surface.Surface]
+
+
+@require(lambda fspath: os.path.isabs(fspath))
+def rescale_image_or_retrieve_from_cache(
+    fspath: str, size: Tuple[int, int]
 ) -> pygame.surface.Surface:
-    """Load the image or retrieve it from the memory cache."""
-    image = IMAGE_CACHE.get(str(path), None)
+    """Rescale the image to ``size`` or retrieve the rescaled one from the cache."""
+    key = (fspath, size[0], size[1])
+
+    image = SCALED_IMAGE_CACHE.get(key, None)
     if image is not None:
         return image
 
-    image = pygame.image.load(str(PACKAGE_DIR / path))
-    IMAGE_CACHE[str(path)] = image
+    original = load_image_or_retrieve_from_cache(fspath)
+
+    # As we rescale each image only once, we can afford the filtered (and SIMD-
+    # accelerated) scaling. It works only on 24-bit and 32-bit surfaces, though.
+    if original.get_bitsize() in (24, 32):
+        image = pygame.transform.smoothscale(original, size)
+    else:
+        image = pygame.transform.scale(original, size)
+
+    SCALED_IMAGE_CACHE[key] = image
     return image
 
 
-def render(state: State, surface: pygame.surface.Surface) -> None:
-    """Render the state on the screen."""
+FONT_CACHE = dict()  # type: MutableMapping[int, pygame.font.Font]
+
+
+def load_font_or_retrieve_from_cache(size: int) -> pygame.font.Font:
+    """Load the font of the given ``size`` or retrieve it from the memory cache."""
+    font = FONT_CACHE.get(size, None)
+    if font is not None:
+        return font
+
+    font = pygame.font.Font(FONT_FSPATH, size)
+    FONT_CACHE[size] = font
+    return font
+
+
+TEXT_CACHE = dict()  # type: MutableMapping[Tuple[str, int], pygame.surface.Surface]
+
+
+def render_text_or_retrieve_from_cache(text: str, size: int) -> pygame.surface.Surface:
+    """Render the white ``text`` in the font of ``size`` or retrieve it from cache."""
+    key = (text, size)
+
+    rendered = TEXT_CACHE.get(key, None)
+    if rendered is not None:
+        return rendered
+
+    rendered = load_font_or_retrieve_from_cache(size).render(
+        text, True, (255, 255, 255)
+    )
+    TEXT_CACHE[key] = rendered
+    return rendered
+
+
+def render(state: State, surface: pygame.surface.Surface, layout: Layout) -> Drawing:
+    """Render the state on the screen measured by ``layout``."""
     if state.game_over:
-        render_game_over(state, surface)
-    else:
-        render_game(state, surface)
+        return render_game_over(state, surface, layout)
+
+    return render_game(state, surface, layout)
+
+
+def determine_dirty_rects(before: Drawing, after: Drawing) -> List[pygame.Rect]:
+    """
+    Determine the areas of the screen which changed between the two drawings.
+
+    Both the areas of the new content and the areas of the removed content
+    need to be updated:
+
+    >>> before = [("a", pygame.Rect(0, 0, 10, 10)), ("b", pygame.Rect(20, 0, 5, 5))]
+    >>> after = [("a", pygame.Rect(0, 0, 10, 10)), ("c", pygame.Rect(30, 0, 5, 5))]
+    >>> determine_dirty_rects(before, after)
+    [<rect(30, 0, 5, 5)>, <rect(20, 0, 5, 5)>]
+
+    >>> determine_dirty_rects(before, before)
+    []
+    """
+    return [rect for item, rect in after if (item, rect) not in before] + [
+        rect for item, rect in before if (item, rect) not in after
+    ]
 
 
 def main(prog: str) -> int:
@@ -499,9 +1017,22 @@ def main(prog: str) -> int:
     :return: exit code
     """
     pygame.joystick.init()
-    joysticks = [
-        pygame.joystick.Joystick(i) for i in range(pygame.joystick.get_count())
-    ]
+
+    # We open each joystick only briefly to read out its name and GUID. Only the
+    # joystick selected for the game is kept open later so that SDL does not need to
+    # pump the events of the other devices.
+    joystick_names_guids = []  # type: List[Tuple[str, str]]
+
+    # If there are multiple joysticks of the same kind, we pick the first one.
+    joystick_index_by_guid = dict()  # type: MutableMapping[str, int]
+
+    for i in range(pygame.joystick.get_count()):
+        joystick = pygame.joystick.Joystick(i)
+        name, guid = joystick.get_name(), joystick.get_guid()
+        joystick.quit()
+
+        joystick_names_guids.append((name, guid))
+        joystick_index_by_guid.setdefault(guid, i)
 
     parser = argparse.ArgumentParser(prog=prog, description=__doc__)
     parser.add_argument(
@@ -511,12 +1042,12 @@ def main(prog: str) -> int:
     parser.add_argument(
         "--list_joysticks", help="List joystick GUIDs and exit", action="store_true"
     )
-    if len(joysticks) >= 1:
+    if len(joystick_names_guids) >= 1:
         parser.add_argument(
             "--joystick",
             help="Joystick to use for the game",
-            choices=[joystick.get_guid() for joystick in joysticks],
-            default=joysticks[0].get_guid(),
+            choices=[guid for _, guid in joystick_names_guids],
+            default=joystick_names_guids[0][1],
         )
 
     # NOTE (mristin, 2022-12-16):
@@ -527,15 +1058,15 @@ def main(prog: str) -> int:
         return 0
 
     if "--list_joysticks" in sys.argv and "--help" not in sys.argv:
-        for joystick in joysticks:
-            print(f"Joystick {joystick.get_name()}, GUID: {joystick.get_guid()}")
+        for name, guid in joystick_names_guids:
+            print(f"Joystick {name}, GUID: {guid}")
         return 0
 
     args = parser.parse_args()
 
     # noinspection PyUnusedLocal
     active_joystick = None  # type: Optional[pygame.joystick.Joystick]
-    if len(joysticks) == 0:
+    if len(joystick_names_guids) == 0:
         print(
             "There are no joysticks plugged in. Judo-dance requires a joystick.",
             file=sys.stderr,
@@ -543,9 +1074,10 @@ def main(prog: str) -> int:
         return 1
 
     else:
-        active_joystick = next(
-            joystick for joystick in joysticks if joystick.get_guid() == args.joystick
+        active_joystick = pygame.joystick.Joystick(
+            joystick_index_by_guid[args.joystick]
         )
+        active_joystick.init()
 
     assert active_joystick is not None
     print(
@@ -567,20 +1099,39 @@ def main(prog: str) -> int:
         0: judodance.events.Button.LEFT,
     }
 
+    # We inspect only the mapped buttons, and pre-compute their bits in the mask.
+    # The unmapped buttons are ignored anyhow.
+    button_count = active_joystick.get_numbuttons()
+    mapped_button_bits = tuple(
+        (button_index, button.value)
+        for button_index, button in button_map.items()
+        if button_index < button_count
+    )
+
+    # A small buffer of 512 samples (about 12 ms at 44.1 kHz) keeps the latency
+    # between playing and hearing an announcement low, while it is still large
+    # enough not to underrun. The buffer needs to be set *before* pygame.init(),
+    # which would otherwise already initialize the mixer with the defaults.
+    pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
     pygame.init()
-    pygame.mixer.pre_init()
     pygame.mixer.init()
 
     pygame.display.set_caption("Judo Dance")
     surface = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
 
+    # The screen is never resized in the full-screen mode, so we measure it only once.
+    layout = Layout(surface)
+
     task_database = create_task_database()
     error = check_all_files_exist(task_database)
     if error is not None:
         print(error, file=sys.stderr)
         return 1
 
-    now = time.time()
+    preload_sounds(task_database)
+    preload_images(task_database, layout)
+
+    now = time.monotonic()
 
     game_duration = 120  # in seconds
 
@@ -590,57 +1141,95 @@ def main(prog: str) -> int:
         game_end=now + game_duration,
     )
 
-    our_event_queue = [
-        judodance.events.NeedToAnnounce()
-    ]  # type: List[judodance.events.EventUnion]
+    our_event_queue = collections.deque(
+        [judodance.events.NEED_TO_ANNOUNCE]
+    )  # type: Deque[judodance.events.EventUnion]
+
+    # We block the events which we do not handle on the SDL side so that they never
+    # enter the queue, and we do not have to iterate over them in Python.
+    #
+    # The game only cares about which buttons are currently pressed, not about
+    # the history of the presses. Hence, we do not handle the joystick button events,
+    # but sample the state of the joystick once per frame. SDL updates the state of
+    # the joystick even if its events are blocked.
+    #
+    # The expose events need to pass as well so that we can re-draw the screen.
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(
+        [pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE]
+    )
+
+    # Bitmask of the buttons as sampled in the previous frame
+    sampled_mask = 0
 
-    # Reuse the tick object so that we don't have to create it every time
-    tick_event = judodance.events.Tick()
+    # The game shows a static scene most of the time, so there is no need to spin
+    # the loop faster than the display refreshes. See FRAMES_PER_SECOND.
+    clock = pygame.time.Clock()
+
+    previous_drawing = None  # type: Optional[Drawing]
 
     try:
         while not state.received_quit:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    our_event_queue.append(judodance.events.ReceivedQuit())
+            pygame.event.pump()
 
-                elif (
-                    event.type in (pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP)
-                    and joysticks[event.instance_id] is active_joystick
-                ):
-                    # List all the active buttons on this event
-                    active_button_set = set()  # type: Set[judodance.events.Button]
-                    for button_index in range(active_joystick.get_numbuttons()):
-                        button_active = active_joystick.get_button(button_index) > 0
-
-                        if button_active:
-                            button_in_action = button_map.get(button_index, None)
-                            if button_in_action is not None:
-                                active_button_set.add(button_in_action)
-                            else:
-                                # Ignore unmapped buttons
-                                pass
-
-                    our_event_queue.append(
-                        judodance.events.ButtonsChanged(active_button_set)
-                    )
+            for event in pygame.event.get(pump=False):
+                if event.type == pygame.QUIT:
+                    our_event_queue.append(judodance.events.RECEIVED_QUIT)
 
                 elif event.type == pygame.KEYDOWN and event.key in (
                     pygame.K_ESCAPE,
                     pygame.K_q,
                 ):
-                    our_event_queue.append(judodance.events.ReceivedQuit())
+                    our_event_queue.append(judodance.events.RECEIVED_QUIT)
+
+                elif event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                    # The window has been covered or minimized, so whatever was
+                    # not re-drawn since is lost. We need to re-draw and show the
+                    # whole screen, not only the changed areas.
+                    previous_drawing = None
+                    state.dirty = True
 
                 else:
                     # Ignore the event that we do not handle
                     pass
 
-            our_event_queue.append(tick_event)
+            # The joystick state has been updated by the pump above.
+            active_mask = 0
+            for button_index, button_bit in mapped_button_bits:
+                if active_joystick.get_button(button_index) > 0:
+                    active_mask |= button_bit
+
+            if active_mask != sampled_mask:
+                our_event_queue.append(judodance.events.ButtonsChanged(active_mask))
+                sampled_mask = active_mask
+
+            our_event_queue.append(judodance.events.TICK)
+
+            # We sample the clock only once per frame so that all the events of
+            # the frame observe the same time.
+            now = time.monotonic()
 
             while len(our_event_queue) > 0:
-                handle(state, our_event_queue, task_database)
+                handle(state, our_event_queue, task_database, now)
+
+            # Most of the frames are identical, so we re-draw only if the state
+            # changed in a visible way.
+            if state.dirty:
+                drawing = render(state, surface, layout)
+
+                # We push only the changed areas to the display, except for the first
+                # frame where the whole screen needs to be shown.
+                if previous_drawing is None:
+                    pygame.display.flip()
+                else:
+                    pygame.display.update(
+                        determine_dirty_rects(previous_drawing, drawing)
+                    )
+
+                previous_drawing = drawing
+                state.dirty = False
 
-            render(state, surface)
-            pygame.display.flip()
+            clock.tick(FRAMES_PER_SECOND)
     finally:
         pygame.joystick.quit()
         pygame.quit()